@@ -16,6 +16,7 @@ the game into a different interface.
 from __future__ import annotations
 
 import argparse
+import functools
 import random
 import textwrap
 from dataclasses import dataclass
@@ -94,8 +95,26 @@ FACT_SETS: dict[str, tuple[str, ...]] = {
     ),
 }
 
+# Topic/prompt pairs for the default pool, materialised once for topic picks.
+_DEFAULT_ITEMS: tuple[tuple[str, tuple[str, ...]], ...] = tuple(FACT_SETS.items())
 
-@dataclass(frozen=True)
+_IMPOSTER_MESSAGE = textwrap.fill(
+    "You drew the imposter card! Listen to everyone else's stories,"
+    " then invent your own and try to blend in."
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _briefing_message(topic: str, prompt: str) -> str:
+    """Return the wrapped briefing for a truthful player, cached per prompt."""
+
+    return textwrap.fill(
+        f"Secret topic: {topic.title()}. Your prompt when the spotlight is on"
+        f" you: {prompt}"
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class PlayerAssignment:
     """Information given to a single player for a round."""
 
@@ -106,18 +125,16 @@ class PlayerAssignment:
         """Return the text shown to a player during the briefing phase."""
 
         if self.is_imposter:
-            return textwrap.fill(
-                "You drew the imposter card! Listen to everyone else's stories,"
-                " then invent your own and try to blend in."
-            )
+            return _IMPOSTER_MESSAGE
         assert self.prompt is not None
-        return textwrap.fill(
-            f"Secret topic: {topic.title()}. Your prompt when the spotlight is on"
-            f" you: {self.prompt}"
-        )
+        return _briefing_message(topic, self.prompt)
+
+
+# Assignments are immutable and the imposter's never varies, so share one.
+_IMPOSTER_ASSIGNMENT = PlayerAssignment(is_imposter=True, prompt=None)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoundSetup:
     """Complete configuration for a single round of the game."""
 
@@ -142,16 +159,16 @@ def _sample_facts(
 
     if len(facts) >= count:
         # Sample without replacement when we can provide unique facts.
-        return rng.sample(list(facts), count)
+        # ``random.sample`` indexes any sequence, so no list copy is needed.
+        return rng.sample(facts, count)
 
     # When we need more facts than are available, provide every fact at least
-    # once, then keep drawing with replacement for the remainder.  Shuffling the
-    # base set up front keeps the distribution fair.
+    # once, then draw the remainder with replacement in a single batch.
+    # Shuffling the base set up front keeps the distribution fair.
     pool = list(facts)
     rng.shuffle(pool)
-    while len(pool) < count:
-        pool.append(rng.choice(facts))
-    return pool[:count]
+    pool.extend(rng.choices(facts, k=count - len(pool)))
+    return pool
 
 
 def generate_round(
@@ -177,22 +194,23 @@ def generate_round(
         raise ValueError("The game needs at least three players")
 
     rng = rng or random.Random()
-    available_facts = fact_sets or FACT_SETS
-    topic, facts = rng.choice(tuple(available_facts.items()))
+    items = tuple(fact_sets.items()) if fact_sets else _DEFAULT_ITEMS
+    topic, facts = items[rng.randrange(len(items))]
 
     imposter_index = rng.randrange(num_players)
     prompt_count = num_players - 1
     prompt_pool = _sample_facts(facts, prompt_count, rng)
 
-    assignments: list[PlayerAssignment] = []
-    prompt_iter = iter(prompt_pool)
+    # Every slot starts as the shared imposter card; all but the imposter's
+    # slot are then overwritten with a prompt in a single indexed pass.
+    assignments = [_IMPOSTER_ASSIGNMENT] * num_players
+    prompt_index = 0
     for idx in range(num_players):
-        if idx == imposter_index:
-            assignments.append(PlayerAssignment(is_imposter=True, prompt=None))
-        else:
-            assignments.append(
-                PlayerAssignment(is_imposter=False, prompt=next(prompt_iter))
+        if idx != imposter_index:
+            assignments[idx] = PlayerAssignment(
+                is_imposter=False, prompt=prompt_pool[prompt_index]
             )
+            prompt_index += 1
 
     return RoundSetup(
         topic=topic,
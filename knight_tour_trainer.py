@@ -24,7 +24,7 @@ from any standard Python installation.
 from __future__ import annotations
 
 import argparse
-import itertools
+import functools
 import sys
 from typing import Iterator, List, Optional, Sequence, Tuple
 
@@ -34,6 +34,9 @@ BOARD_SIZE: int = 8
 
 Move = Tuple[int, int]
 
+_QUIT_WORDS: frozenset[str] = frozenset({"quit", "exit"})
+"""Answers that end the recall quiz early."""
+
 
 def _is_on_board(square: Move) -> bool:
     """Return ``True`` if *square* lies inside the chessboard boundaries."""
@@ -60,15 +63,48 @@ def _knight_moves(square: Move) -> Iterator[Move]:
         yield row + d_row, col + d_col
 
 
-def _count_onward_moves(square: Move, visited: set[Move]) -> int:
-    """Count valid onward moves for Warnsdorff's heuristic."""
+def _square_index(square: Move) -> int:
+    """Return the bitboard index (``row * BOARD_SIZE + col``) of *square*."""
+
+    row, col = square
+    return row * BOARD_SIZE + col
+
+
+_NEIGHBOR_MASK: List[int] = [
+    sum(
+        1 << _square_index(nxt)
+        for nxt in _knight_moves(divmod(index, BOARD_SIZE))
+        if _is_on_board(nxt)
+    )
+    for index in range(BOARD_SIZE * BOARD_SIZE)
+]
+"""Bitboard of on-board knight destinations for every square index."""
+
+
+def _count_onward_moves(square: int, visited: int) -> int:
+    """Count valid onward moves for Warnsdorff's heuristic.
+
+    *square* is a bitboard index and *visited* a bitboard of visited squares.
+    """
+
+    return (_NEIGHBOR_MASK[square] & ~visited).bit_count()
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    """Yield the index of every set bit in *mask*, lowest first."""
 
-    return sum(1 for nxt in _knight_moves(square) if _is_on_board(nxt) and nxt not in visited)
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
 
 
-def generate_knights_tour(start: Move = (0, 0)) -> List[Move]:
+def generate_knights_tour(start: Move = (0, 0)) -> Tuple[Move, ...]:
     """Generate a complete Knight's Tour using Warnsdorff's rule.
 
+    The heuristic breaks ties deterministically, so the tour for a given
+    *start* never changes and results are cached per starting square.
+
     Parameters
     ----------
     start:
@@ -77,49 +113,72 @@ def generate_knights_tour(start: Move = (0, 0)) -> List[Move]:
 
     Returns
     -------
-    list[tuple[int, int]]
-        The ordered list of 64 moves covering every square exactly once.
+    tuple[tuple[int, int], ...]
+        The ordered 64 moves covering every square exactly once.
 
     Raises
     ------
+    ValueError
+        If *start* lies outside the chessboard.
     RuntimeError
         If a complete tour cannot be produced (unlikely on a standard board).
     """
 
-    path: List[Move] = [start]
-    visited: set[Move] = {start}
+    row, col = start
+    if not _is_on_board((row, col)):
+        raise ValueError(f"Start square {start!r} is off the board")
+    return _build_tour((row, col))
+
+
+@functools.lru_cache(maxsize=64)
+def _build_tour(start: Move) -> Tuple[Move, ...]:
+    """Compute the Warnsdorff tour from *start*; see :func:`generate_knights_tour`."""
+
+    current = _square_index(start)
+    visited = 1 << current
+    order: List[int] = [current]
 
     for _ in range(BOARD_SIZE * BOARD_SIZE - 1):
-        current = path[-1]
-        candidates = [
-            nxt
-            for nxt in _knight_moves(current)
-            if _is_on_board(nxt) and nxt not in visited
-        ]
+        candidates = list(_iter_bits(_NEIGHBOR_MASK[current] & ~visited))
 
         if not candidates:
             break
 
         # Apply Warnsdorff's rule: prefer moves with the fewest onward options.
-        next_move = min(
+        # Square indices order the same way as ``(row, col)`` tuples, so ties
+        # are still broken towards the lowest coordinate.
+        current = min(
             candidates,
-            key=lambda move: (_count_onward_moves(move, visited | {move}), move),
+            key=lambda move: (_count_onward_moves(move, visited), move),
         )
 
-        visited.add(next_move)
-        path.append(next_move)
+        visited |= 1 << current
+        order.append(current)
 
+    path = [divmod(index, BOARD_SIZE) for index in order]
     if len(path) != BOARD_SIZE * BOARD_SIZE:
         raise RuntimeError("Failed to construct a full Knight's Tour path")
 
-    return path
+    return tuple(path)
+
+
+_ALGEBRAIC: Tuple[str, ...] = tuple(
+    f"{chr(ord('a') + col)}{row + 1}"
+    for row in range(BOARD_SIZE)
+    for col in range(BOARD_SIZE)
+)
+"""Algebraic names for every square, keyed by bitboard index."""
 
 
 def algebraic(square: Move) -> str:
-    """Convert a coordinate ``(row, column)`` to algebraic notation (``"a1"``)."""
+    """Convert a coordinate ``(row, column)`` to algebraic notation (``"a1"``).
 
-    row, col = square
-    return f"{chr(ord('a') + col)}{row + 1}"
+    Raises :class:`ValueError` if *square* lies outside the chessboard.
+    """
+
+    if not _is_on_board(square):
+        raise ValueError(f"Square {square!r} is off the board")
+    return _ALGEBRAIC[_square_index(square)]
 
 
 def reversed_tour(path: Sequence[Move]) -> List[Move]:
@@ -140,25 +199,24 @@ def format_board(path: Sequence[Move], upto: Optional[int] = None) -> str:
         before this index are included, allowing incremental visualisation.
     """
 
-    board = [["." for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+    # One flat buffer of pre-padded cells, indexed like the tour bitboard.
+    cells = [" ."] * (BOARD_SIZE * BOARD_SIZE)
     upto = len(path) if upto is None else max(0, min(upto, len(path)))
 
-    for move_index, square in enumerate(itertools.islice(path, upto)):
-        row, col = square
-        board[row][col] = str(move_index + 1)
+    for move_number, square in enumerate(path[:upto], start=1):
+        cells[_square_index(square)] = f"{move_number:>2}"
 
     lines = ["  a  b  c  d  e  f  g  h"]
-    for row_index, row in enumerate(board[::-1]):
-        rank = BOARD_SIZE - row_index
-        padded = [value.rjust(2) for value in row]
-        lines.append(f"{rank} {' '.join(padded)}")
+    for row in reversed(range(BOARD_SIZE)):
+        start = row * BOARD_SIZE
+        lines.append(f"{row + 1} {' '.join(cells[start:start + BOARD_SIZE])}")
     lines.append("  a  b  c  d  e  f  g  h")
     return "\n".join(lines)
 
 
 def _print_sequence(path: Sequence[Move], steps: Optional[int], stream) -> None:
     upto = len(path) if steps is None else max(0, min(steps, len(path)))
-    for index, square in enumerate(itertools.islice(path, upto), start=1):
+    for index, square in enumerate(path[:upto], start=1):
         print(f"{index:02d}: {algebraic(square)}", file=stream)
 
 
@@ -174,7 +232,7 @@ def _run_quiz(path: Sequence[Move]) -> int:
     score = 0
     for index, square in enumerate(path, start=1):
         answer = input(f"Move {index:02d}: ").strip().lower()
-        if answer in {"quit", "exit"}:
+        if answer in _QUIT_WORDS:
             break
         if answer == algebraic(square):
             print("  ✓ Correct!\n")
@@ -34,3 +34,28 @@ def test_sample_facts_reuses_pool_when_needed():
     sampled = ifg._sample_facts(facts, 5, rng)
     assert len(sampled) == 5
     assert set(facts).issubset(sampled)
+
+
+def test_generate_round_shares_imposter_assignment():
+    first = ifg.generate_round(4, rng=random.Random(2))
+    second = ifg.generate_round(7, rng=random.Random(3))
+    assert (
+        first.assignments[first.imposter_index]
+        is second.assignments[second.imposter_index]
+    )
+
+
+def test_sample_facts_overflow_is_stable_for_seed():
+    # Pin seeded output so ``--seed`` keeps recreating the same round.
+    sampled = ifg._sample_facts(("one", "two", "three"), 6, random.Random(7))
+    assert sampled == ["three", "one", "two", "two", "one", "three"]
+
+
+def test_generate_round_overflow_is_stable_for_seed():
+    setup = ifg.generate_round(8, rng=random.Random(0))
+    facts = ifg.FACT_SETS[setup.topic]
+    assert setup.topic == "try_not_to_laugh"
+    assert setup.imposter_index == 6
+    assert [
+        None if a.prompt is None else facts.index(a.prompt) for a in setup.assignments
+    ] == [2, 1, 0, 3, 3, 1, None, 3]
@@ -17,6 +17,12 @@ def test_algebraic_round_trip_examples(a, b):
     assert ktt.algebraic(a) != ktt.algebraic(b)
 
 
+@pytest.mark.parametrize("square", [(0, 8), (8, 0), (-1, 0), (0, -1)])
+def test_algebraic_rejects_off_board_squares(square):
+    with pytest.raises(ValueError):
+        ktt.algebraic(square)
+
+
 def test_tour_moves_are_valid_knight_steps():
     tour = ktt.generate_knights_tour()
     for current, nxt in itertools.pairwise(tour):
@@ -39,3 +45,30 @@ def test_board_formatter_renders_requested_steps():
     assert "1" in interior_rows[-1]
     assert "2" in interior_rows[-2]
     assert all(cell != "3" for row in interior_rows for cell in row)
+
+
+@pytest.mark.parametrize(
+    "start", [(row, col) for row in range(ktt.BOARD_SIZE) for col in range(ktt.BOARD_SIZE)]
+)
+def test_tour_from_every_start_square(start):
+    # Warnsdorff's rule can dead-end from a few squares; that must surface as
+    # RuntimeError rather than a partial tour.
+    try:
+        tour = ktt.generate_knights_tour(start)
+    except RuntimeError:
+        return
+    assert tour[0] == start
+    assert len(set(tour)) == ktt.BOARD_SIZE ** 2
+    for current, nxt in itertools.pairwise(tour):
+        assert sorted((abs(current[0] - nxt[0]), abs(current[1] - nxt[1]))) == [1, 2]
+
+
+@pytest.mark.parametrize("start", [(-1, 0), (0, -1), (0, 8), (8, 0)])
+def test_tour_rejects_off_board_start(start):
+    with pytest.raises(ValueError):
+        ktt.generate_knights_tour(start)
+
+
+def test_tour_is_cached_per_start_square():
+    assert ktt.generate_knights_tour() is ktt.generate_knights_tour((0, 0))
+    assert isinstance(ktt.generate_knights_tour(), tuple)